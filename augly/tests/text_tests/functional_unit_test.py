@@ -34,28 +34,29 @@ class FunctionalTextUnitTest(unittest.TestCase):
 
     def test_apply_lambda(self) -> None:
         augmented_apply_lambda = txtaugs.apply_lambda(self.texts)
-        self.assertTrue(augmented_apply_lambda[0] == self.texts[0])
+        self.assertEqual(augmented_apply_lambda[0], self.texts[0])
 
     def test_change_case(self) -> None:
         augmented_words = txtaugs.change_case(self.texts[0], cadence=3.0, case="upper")
-        self.assertTrue(
-            augmented_words[0]
-            == "THE quick brown 'FOX' couldn't jump OVER the green, GRASSY hill.",
+        self.assertEqual(
+            augmented_words[0],
+            "THE quick brown 'FOX' couldn't jump OVER the green, GRASSY hill.",
         )
 
     def test_contractions(self) -> None:
         augmented_words = txtaugs.contractions(
             "I would call him but I do not know where he has gone", aug_p=0.7
         )
-        self.assertTrue(
-            augmented_words[0] == "I would call him but I don't know where he's gone"
+        self.assertEqual(
+            augmented_words[0],
+            "I would call him but I don't know where he's gone",
         )
 
     def test_get_baseline(self) -> None:
         augmented_baseline = txtaugs.get_baseline(self.texts)
-        self.assertTrue(
-            augmented_baseline[0]
-            == "The quick brown 'fox' couldn't jump over the green, grassy hill."
+        self.assertEqual(
+            augmented_baseline[0],
+            "The quick brown 'fox' couldn't jump over the green, grassy hill.",
         )
 
     def test_insert_punctuation_chars(self) -> None:
@@ -254,16 +255,16 @@ class FunctionalTextUnitTest(unittest.TestCase):
 
     def test_merge_words(self) -> None:
         augmented_split_words = txtaugs.merge_words(self.texts, aug_word_p=0.3, n=1)
-        self.assertTrue(
-            augmented_split_words[0]
-            == "Thequick brown 'fox' couldn'tjump overthe green, grassy hill."
+        self.assertEqual(
+            augmented_split_words[0],
+            "Thequick brown 'fox' couldn'tjump overthe green, grassy hill.",
         )
         augmented_split_words_targetted = txtaugs.merge_words(
             self.texts, aug_word_p=0.3, n=1, priority_words=self.priority_words
         )
-        self.assertTrue(
-            augmented_split_words_targetted[0]
-            == "The quick brown 'fox' couldn'tjump over the green, grassyhill."
+        self.assertEqual(
+            augmented_split_words_targetted[0],
+            "The quick brown 'fox' couldn'tjump over the green, grassyhill.",
         )
 
     def test_replace_bidirectional(self) -> None:
@@ -306,23 +307,23 @@ class FunctionalTextUnitTest(unittest.TestCase):
         augmented_fun_fonts_word = txtaugs.replace_fun_fonts(
             self.texts, granularity="word", aug_p=0.3, vary_fonts=False, n=1
         )
-        self.assertTrue(
-            augmented_fun_fonts_word[0]
-            == "The 𝙦𝙪𝙞𝙘𝙠 brown '𝙛𝙤𝙭' 𝙘𝙤𝙪𝙡𝙙𝙣'𝙩 jump over the green, 𝙜𝙧𝙖𝙨𝙨𝙮 hill."
+        self.assertEqual(
+            augmented_fun_fonts_word[0],
+            "The 𝙦𝙪𝙞𝙘𝙠 brown '𝙛𝙤𝙭' 𝙘𝙤𝙪𝙡𝙙𝙣'𝙩 jump over the green, 𝙜𝙧𝙖𝙨𝙨𝙮 hill.",
         )
         augmented_fun_fonts_char = txtaugs.replace_fun_fonts(
             self.texts, granularity="char", aug_p=0.3, vary_fonts=True, n=1
         )
-        self.assertTrue(
-            augmented_fun_fonts_char[0]
-            == "T̷he̳ 𝒒uiᴄk 𝙗r𝓸wn 'fo̲x' coul͎dn't jump over t̶h̷e green, 𝑔ra͎ss̳𝒚 ʜill."
+        self.assertEqual(
+            augmented_fun_fonts_char[0],
+            "T̷he̳ 𝒒uiᴄk 𝙗r𝓸wn 'fo̲x' coul͎dn't jump over t̶h̷e green, 𝑔ra͎ss̳𝒚 ʜill.",
         )
         augmented_fun_fonts_all = txtaugs.replace_fun_fonts(
             self.texts, granularity="all", aug_p=1.0, vary_fonts=False, n=1
         )
-        self.assertTrue(
-            augmented_fun_fonts_all[0]
-            == "𝕋𝕙𝕖 𝕢𝕦𝕚𝕔𝕜 𝕓𝕣𝕠𝕨𝕟 '𝕗𝕠𝕩' 𝕔𝕠𝕦𝕝𝕕𝕟'𝕥 𝕛𝕦𝕞𝕡 𝕠𝕧𝕖𝕣 𝕥𝕙𝕖 𝕘𝕣𝕖𝕖𝕟, 𝕘𝕣𝕒𝕤𝕤𝕪 𝕙𝕚𝕝𝕝."
+        self.assertEqual(
+            augmented_fun_fonts_all[0],
+            "𝕋𝕙𝕖 𝕢𝕦𝕚𝕔𝕜 𝕓𝕣𝕠𝕨𝕟 '𝕗𝕠𝕩' 𝕔𝕠𝕦𝕝𝕕𝕟'𝕥 𝕛𝕦𝕞𝕡 𝕠𝕧𝕖𝕣 𝕥𝕙𝕖 𝕘𝕣𝕖𝕖𝕟, 𝕘𝕣𝕒𝕤𝕤𝕪 𝕙𝕚𝕝𝕝.",
         )
         augmented_fun_fonts_word_targetted = txtaugs.replace_fun_fonts(
             self.texts,
@@ -332,9 +333,9 @@ class FunctionalTextUnitTest(unittest.TestCase):
             n=1,
             priority_words=self.priority_words,
         )
-        self.assertTrue(
-            augmented_fun_fonts_word_targetted[0]
-            == "T͓̽h͓̽e͓̽ quick brown 'fox' couldn't jump over the 𝘨𝘳𝘦𝘦𝘯, g̳r̳a̳s̳s̳y̳ h̴i̴l̴l̴."
+        self.assertEqual(
+            augmented_fun_fonts_word_targetted[0],
+            "T͓̽h͓̽e͓̽ quick brown 'fox' couldn't jump over the 𝘨𝘳𝘦𝘦𝘯, g̳r̳a̳s̳s̳y̳ h̴i̴l̴l̴.",
         )
         augmented_fun_fonts_greek = txtaugs.replace_fun_fonts(
             [
@@ -346,9 +347,9 @@ class FunctionalTextUnitTest(unittest.TestCase):
             fonts_path=FUN_FONTS_GREEK_PATH,
             n=1.0,
         )
-        self.assertTrue(
-            augmented_fun_fonts_greek[0]
-            == "𝝜 γρήγορη καφέ αλεπού 𝛿𝜀𝜈 μπορούσε να πηδήξει πάνω από 𝞽𝞸𝞶 𝝹𝝰𝞃𝝰𝝿𝞀ά𝞂𝝸𝝼𝝾 λόφο."
+        self.assertEqual(
+            augmented_fun_fonts_greek[0],
+            "𝝜 γρήγορη καφέ αλεπού 𝛿𝜀𝜈 μπορούσε να πηδήξει πάνω από 𝞽𝞸𝞶 𝝹𝝰𝞃𝝰𝝿𝞀ά𝞂𝝸𝝼𝝾 λόφο.",
         )
 
     def test_replace_similar_chars(self) -> None:
@@ -430,26 +431,26 @@ class FunctionalTextUnitTest(unittest.TestCase):
         )
 
         augmented_string_from_list = txtaugs.replace_text(texts[0], replace_texts)
-        self.assertTrue(augmented_string_from_list == texts[0])
+        self.assertEqual(augmented_string_from_list, texts[0])
 
         augmented_string_from_list = txtaugs.replace_text(texts[1], replace_texts)
-        self.assertTrue(augmented_string_from_list == replace_texts[texts[1]])
+        self.assertEqual(augmented_string_from_list, replace_texts[texts[1]])
 
         augmented_string_from_string = txtaugs.replace_text(texts[2], replace_string)
-        self.assertTrue(augmented_string_from_string == replace_string)
+        self.assertEqual(augmented_string_from_string, replace_string)
 
     def test_replace_upside_down(self) -> None:
         augmented_upside_down_all = txtaugs.replace_upside_down(self.texts)
-        self.assertTrue(
-            augmented_upside_down_all[0]
-            == "˙llᴉɥ ʎssɐɹɓ 'uǝǝɹɓ ǝɥʇ ɹǝʌo dɯnɾ ʇ,uplnoɔ ,xoɟ, uʍoɹq ʞɔᴉnb ǝɥꞱ"
+        self.assertEqual(
+            augmented_upside_down_all[0],
+            "˙llᴉɥ ʎssɐɹɓ 'uǝǝɹɓ ǝɥʇ ɹǝʌo dɯnɾ ʇ,uplnoɔ ,xoɟ, uʍoɹq ʞɔᴉnb ǝɥꞱ",
         )
         augmented_upside_down_words = txtaugs.replace_upside_down(
             self.texts, granularity="word", aug_p=0.3
         )
-        self.assertTrue(
-            augmented_upside_down_words[0]
-            == "ǝɥꞱ ʞɔᴉnb brown 'xoɟ' ʇ,uplnoɔ jump over the green, grassy hill."
+        self.assertEqual(
+            augmented_upside_down_words[0],
+            "ǝɥꞱ ʞɔᴉnb brown 'xoɟ' ʇ,uplnoɔ jump over the green, grassy hill.",
         )
         augmented_upside_down_chars = txtaugs.replace_upside_down(
             self.texts[0], granularity="char", aug_p=0.3, n=2
@@ -464,16 +465,16 @@ class FunctionalTextUnitTest(unittest.TestCase):
 
     def test_replace_words(self) -> None:
         augmented_words = txtaugs.replace_words(self.texts, aug_word_p=0.3)
-        self.assertTrue(augmented_words[0] == self.texts[0])
+        self.assertEqual(augmented_words[0], self.texts[0])
 
         augmented_words = txtaugs.replace_words(
             self.texts,
             mapping={"jump": "hop", "brown": "orange", "green": "blue", "the": "a"},
             aug_word_p=1.0,
         )
-        self.assertTrue(
-            augmented_words[0]
-            == "A quick orange 'fox' couldn't hop over a blue, grassy hill.",
+        self.assertEqual(
+            augmented_words[0],
+            "A quick orange 'fox' couldn't hop over a blue, grassy hill.",
         )
 
         augmented_words = txtaugs.replace_words(
@@ -482,9 +483,9 @@ class FunctionalTextUnitTest(unittest.TestCase):
             aug_word_p=1.0,
             ignore_words=["green", "jump"],
         )
-        self.assertTrue(
-            augmented_words[0]
-            == "A quick orange 'fox' couldn't jump over a green, grassy hill.",
+        self.assertEqual(
+            augmented_words[0],
+            "A quick orange 'fox' couldn't jump over a green, grassy hill.",
         )
 
     def test_simulate_typos(self) -> None:
@@ -538,17 +539,17 @@ class FunctionalTextUnitTest(unittest.TestCase):
         augmented_gender_swap_words = txtaugs.swap_gendered_words(
             self.fairness_texts[0], aug_word_p=0.3
         )
-        self.assertTrue(
-            augmented_gender_swap_words
-            == "The queen and king have a daughter named Raj and a son named Amanda.",
+        self.assertEqual(
+            augmented_gender_swap_words,
+            "The queen and king have a daughter named Raj and a son named Amanda.",
         )
 
         ignore_augmented_gender_swap_words = txtaugs.swap_gendered_words(
             self.fairness_texts[0], aug_word_p=0.3, ignore_words=["son"]
         )
-        self.assertTrue(
-            ignore_augmented_gender_swap_words
-            == "The queen and king have a son named Raj and a son named Amanda.",
+        self.assertEqual(
+            ignore_augmented_gender_swap_words,
+            "The queen and king have a son named Raj and a son named Amanda.",
         )
 
 
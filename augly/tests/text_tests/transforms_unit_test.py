@@ -6,15 +6,46 @@
 # LICENSE file in the root directory of this source tree.
 # @lint-ignore-every UTF8
 
+import ast
+import functools
 import json
 import os
 import random
+import importlib
+import sys
 import unittest
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from unittest.mock import patch
 
+import augly
 from augly import text as txtaugs
 from augly.utils import TEXT_METADATA_PATH
 
+# Expected outputs of the Insert*Chars transforms with granularity="all"
+PUNCTUATION_CHARS_TEXT = (
+    "T?h?e? ?q?u?i?c?k? ?b?r?o?w?n? ?'?f?o?x?'? ?c?o?u?l?d?n?'?t? "
+    "?j?u?m?p? ?o?v?e?r? ?t?h?e? ?g?r?e?e?n?,? ?g?r?a?s?s?y? ?h?i?l?l?."
+)
+WHITESPACE_CHARS_TEXT = (
+    "T h e   q u i c k   b r o w n   ' f o x '   c o u l d n ' t   "
+    "j u m p   o v e r   t h e   g r e e n ,   g r a s s y   h i l l ."
+)
+# Renders as: "T‌h‌e‌ ‌q‌u‌i‌c‌k‌ ‌b‌r‌o‌w‌n‌ ‌'‌f‌o‌x‌'‌ ‌c‌o‌u‌l‌d‌n‌'‌t‌ ‌j‌u‌m‌p‌ ‌o‌v‌e‌r‌ ‌t‌h‌e‌ ‌g‌r‌e‌e‌n‌,‌ ‌g‌r‌a‌s‌s‌y‌ ‌h‌i‌l‌l‌."
+ZERO_WIDTH_CHARS_TEXT = (
+    "T\u200ch\u200ce\u200c \u200cq\u200cu\u200ci\u200cc\u200ck\u200c "
+    "\u200cb\u200cr\u200co\u200cw\u200cn\u200c \u200c'\u200cf\u200co"
+    "\u200cx\u200c'\u200c \u200cc\u200co\u200cu\u200cl\u200cd\u200cn"
+    "\u200c'\u200ct\u200c \u200cj\u200cu\u200cm\u200cp\u200c \u200co"
+    "\u200cv\u200ce\u200cr\u200c \u200ct\u200ch\u200ce\u200c \u200cg"
+    "\u200cr\u200ce\u200ce\u200cn\u200c,\u200c \u200cg\u200cr\u200ca"
+    "\u200cs\u200cs\u200cy\u200c \u200ch\u200ci\u200cl\u200cl\u200c."
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _norm_split(path: str) -> Tuple[str, ...]:
+    return tuple(os.path.normpath(path).split(os.path.sep))
+
 
 def are_equal_metadata(
     actual_meta: List[Dict[str, Any]], expected_meta: List[Dict[str, Any]]
@@ -23,31 +54,41 @@ def are_equal_metadata(
         return True
 
     for actual_dict, expected_dict in zip(actual_meta, expected_meta):
-        for (act_k, act_v), (exp_k, exp_v) in zip(
-            sorted(actual_dict.items(), key=lambda kv: kv[0]),
-            sorted(expected_dict.items(), key=lambda kv: kv[0]),
-        ):
-            if act_k != exp_k:
-                return False
+        # Stricter than zipping over sorted items, which ignored trailing extra keys
+        if actual_dict.keys() != expected_dict.keys():
+            return False
 
+        for exp_k, exp_v in expected_dict.items():
+            act_v = actual_dict[exp_k]
             if act_v == exp_v:
                 continue
 
             """
             Allow relative paths in expected metadata: just check that the end of the
-            actual path matches the expected path
+            actual path matches the expected path. An actual value shorter than the
+            expected one is rejected outright, even if the two would agree after
+            normalization (e.g. "foo.json" vs "./foo.json")
             """
             if not (
-                isinstance(act_v, str)
-                and isinstance(exp_v, str)
-                and os.path.normpath(act_v[-len(exp_v) :]).split(os.path.sep)
-                == os.path.normpath(exp_v).split(os.path.sep)
+                type(act_v) is str
+                and type(exp_v) is str
+                and len(act_v) >= len(exp_v)
+                and _norm_split(act_v[-len(exp_v) :]) == _norm_split(exp_v)
             ):
                 return False
 
     return True
 
 
+_EXPECTED_METADATA: Dict[str, List[Dict[str, Any]]] = {}
+
+
+def setUpModule():
+    global _EXPECTED_METADATA
+    with open(TEXT_METADATA_PATH, "r") as f:
+        _EXPECTED_METADATA = json.load(f)
+
+
 class TransformsTextUnitTest(unittest.TestCase):
     def test_import(self) -> None:
         try:
@@ -56,17 +97,54 @@ class TransformsTextUnitTest(unittest.TestCase):
             self.fail("transforms failed to import")
         self.assertTrue(dir(transforms))
 
-    def setUp(self):
-        self.metadata = []
-        self.maxDiff = None
-        random.seed(123)
+    def test_submodule_attribute_access(self) -> None:
+        # Call __getattr__ directly: other tests import the submodules, which binds
+        # them on the package without going through it
+        for submodule in txtaugs._SUBMODULES:
+            self.assertIs(
+                txtaugs.__getattr__(submodule),
+                importlib.import_module(f"augly.text.{submodule}"),
+            )
+
+    def test_lazy_import(self) -> None:
+        prefixes = ("augly.text", "nlpaug")
+        with patch.dict(sys.modules), patch.object(augly, "text", txtaugs):
+            for name in [n for n in sys.modules if n.startswith(prefixes)]:
+                del sys.modules[name]
+
+            importlib.import_module("augly.text")
+            loaded = {name for name in sys.modules if name.startswith(prefixes)}
+
+        # A bare import must not pull in the submodules or their dependencies
+        self.assertEqual(loaded, {"augly.text"})
+
+    def test_lazy_exports(self) -> None:
+        with open(txtaugs.__file__, "r") as f:
+            tree = ast.parse(f.read())
+
+        type_checking_imports = {
+            alias.name: node.module
+            for block in tree.body
+            if isinstance(block, ast.If)
+            and isinstance(block.test, ast.Name)
+            and block.test.id == "TYPE_CHECKING"
+            for node in block.body
+            if isinstance(node, ast.ImportFrom)
+            for alias in node.names
+        }
+        self.assertEqual(type_checking_imports, txtaugs._LAZY)
+        self.assertEqual(set(txtaugs.__all__), set(txtaugs._LAZY))
+
+    def get_expected_metadata(self, fname: str) -> List[Dict[str, Any]]:
+        # The parsed file is shared across the process, so hand out fresh metadata
+        # dicts that tests can override keys in without affecting one another.
+        # Nested values (e.g. kwargs) are still shared and must not be mutated
+        return [dict(d) for d in _EXPECTED_METADATA[fname]]
 
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-
-        with open(TEXT_METADATA_PATH, "r") as f:
-            cls.expected_metadata = json.load(f)
+        cls.maxDiff = None
 
         cls.texts = ["The quick brown 'fox' couldn't jump over the green, grassy hill."]
         cls.priority_words = ["green", "grassy", "hill"]
@@ -75,54 +153,56 @@ class TransformsTextUnitTest(unittest.TestCase):
             "The king and queen have a son named Raj and a daughter named Amanda.",
         ]
 
-    def test_ApplyLambda(self) -> None:
-        augmented_apply_lambda = txtaugs.ApplyLambda()(
-            self.texts, metadata=self.metadata
+    def evaluate_class(
+        self,
+        transform_class: Callable[..., List[str]],
+        fname: str,
+        expected_texts: List[str],
+        texts: Optional[List[str]] = None,
+        **kwargs,
+    ) -> None:
+        metadata = []
+        augmented_texts = transform_class(
+            self.texts if texts is None else texts, metadata=metadata, **kwargs
         )
 
-        self.assertTrue(augmented_apply_lambda[0] == self.texts[0])
+        self.assertEqual(augmented_texts, expected_texts)
         self.assertTrue(
-            are_equal_metadata(self.metadata, self.expected_metadata["apply_lambda"]),
+            are_equal_metadata(metadata, self.get_expected_metadata(fname)),
+            "Expected and outputted metadata do not match",
         )
 
-    def test_ChangeCase(self) -> None:
-        augmented_words = txtaugs.ChangeCase(
-            granularity="char", cadence=5.0, case="random"
-        )(self.texts, metadata=self.metadata)
+    def test_ApplyLambda(self) -> None:
+        self.evaluate_class(txtaugs.ApplyLambda(), "apply_lambda", self.texts)
 
-        self.assertTrue(
-            augmented_words[0]
-            == "The qUick brown 'fox' couldn't jump over the Green, graSsy hill."
-        )
-        self.assertTrue(
-            are_equal_metadata(self.metadata, self.expected_metadata["change_case"])
+    def test_ChangeCase(self) -> None:
+        self.evaluate_class(
+            txtaugs.ChangeCase(granularity="char", cadence=5.0, case="random"),
+            "change_case",
+            ["The qUick brown 'fox' couldn't jump over the Green, graSsy hill."],
         )
 
     def test_Contractions(self) -> None:
-        augmented_words = txtaugs.Contractions(aug_p=1.0)(
-            ["I would call him but I do not know where he has gone"],
-            metadata=self.metadata,
-        )
-
-        self.assertTrue(
-            augmented_words[0] == "I'd call him but I don't know where he's gone"
-        )
-        self.assertTrue(
-            are_equal_metadata(self.metadata, self.expected_metadata["contractions"])
+        self.evaluate_class(
+            txtaugs.Contractions(aug_p=1.0),
+            "contractions",
+            ["I'd call him but I don't know where he's gone"],
+            texts=["I would call him but I do not know where he has gone"],
         )
 
     def test_Compose(self) -> None:
         random.seed(1)
-        augmented_compose = txtaugs.Compose(
-            [
-                txtaugs.OneOf([txtaugs.ReplaceSimilarChars(), txtaugs.SimulateTypos()]),
-                txtaugs.InsertPunctuationChars(),
-                txtaugs.ReplaceFunFonts(),
-            ]
-        )(self.texts, metadata=self.metadata)
-
-        self.assertEqual(
-            augmented_compose,
+        self.evaluate_class(
+            txtaugs.Compose(
+                [
+                    txtaugs.OneOf(
+                        [txtaugs.ReplaceSimilarChars(), txtaugs.SimulateTypos()]
+                    ),
+                    txtaugs.InsertPunctuationChars(),
+                    txtaugs.ReplaceFunFonts(),
+                ]
+            ),
+            "compose",
             [
                 "T... h... e...... u... q... i... c... k...... b... r... o... w... "
                 "n...... '... f... o... x... '...... c... o... u... d... n... '...... "
@@ -131,171 +211,90 @@ class TransformsTextUnitTest(unittest.TestCase):
                 "i...,... l...."
             ],
         )
-        self.assertTrue(
-            are_equal_metadata(self.metadata, self.expected_metadata["compose"]),
-        )
 
     def test_GetBaseline(self) -> None:
-        augmented_baseline = txtaugs.GetBaseline()(self.texts, metadata=self.metadata)
-
-        self.assertTrue(
-            augmented_baseline[0]
-            == "The quick brown 'fox' couldn't jump over the green, grassy hill."
-        )
-        self.assertTrue(
-            are_equal_metadata(self.metadata, self.expected_metadata["get_baseline"]),
+        self.evaluate_class(
+            txtaugs.GetBaseline(),
+            "get_baseline",
+            ["The quick brown 'fox' couldn't jump over the green, grassy hill."],
         )
 
     def test_InsertPunctuationChars(self) -> None:
-        aug_punc_text = txtaugs.InsertPunctuationChars("all", 1.0, False)(
-            self.texts, metadata=self.metadata
-        )
-
+        random.seed(123)
         # Separator inserted between every character (including spaces/punctuation).
-        self.assertEqual(
-            aug_punc_text,
-            [
-                "T?h?e? ?q?u?i?c?k? ?b?r?o?w?n? ?'?f?o?x?'? ?c?o?u?l?d?n?'?t? "
-                "?j?u?m?p? ?o?v?e?r? ?t?h?e? ?g?r?e?e?n?,? ?g?r?a?s?s?y? ?h?i?l?l?."
-            ],
-        )
-        self.assertTrue(
-            are_equal_metadata(
-                self.metadata, self.expected_metadata["insert_punctuation_chars"]
-            ),
+        self.evaluate_class(
+            txtaugs.InsertPunctuationChars("all", 1.0, False),
+            "insert_punctuation_chars",
+            [PUNCTUATION_CHARS_TEXT],
         )
 
     def test_InsertText(self) -> None:
-        aug_inserted_text = txtaugs.InsertText(seed=42)(
-            self.texts, metadata=self.metadata, insert_text=["wolf", "sheep"]
-        )
-
-        self.assertEqual(
-            aug_inserted_text,
+        self.evaluate_class(
+            txtaugs.InsertText(seed=42),
+            "insert_text",
             ["wolf The quick brown 'fox' couldn't jump over the green, grassy hill."],
-        )
-
-        self.assertTrue(
-            are_equal_metadata(self.metadata, self.expected_metadata["insert_text"]),
+            insert_text=["wolf", "sheep"],
         )
 
     def test_InsertWhitespaceChars(self) -> None:
-        aug_whitespace_text = txtaugs.InsertWhitespaceChars("all", 1.0, False)(
-            self.texts, metadata=self.metadata
-        )
-
+        random.seed(123)
         # Separator inserted between every character (including spaces/punctuation).
-        self.assertEqual(
-            aug_whitespace_text,
-            [
-                "T h e   q u i c k   b r o w n   ' f o x '   c o u l d n ' t   "
-                "j u m p   o v e r   t h e   g r e e n ,   g r a s s y   h i l l ."
-            ],
-        )
-        self.assertTrue(
-            are_equal_metadata(
-                self.metadata, self.expected_metadata["insert_whitespace_chars"]
-            ),
+        self.evaluate_class(
+            txtaugs.InsertWhitespaceChars("all", 1.0, False),
+            "insert_whitespace_chars",
+            [WHITESPACE_CHARS_TEXT],
         )
 
     def test_InsertZeroWidthChars(self) -> None:
-        aug_unicode_text = txtaugs.InsertZeroWidthChars("all", 1.0, False)(
-            self.texts, metadata=self.metadata
-        )
-
+        random.seed(123)
         # Separator inserted between every character (including spaces/punctuation).
-        # Renders as: "T‌h‌e‌ ‌q‌u‌i‌c‌k‌ ‌b‌r‌o‌w‌n‌ ‌'‌f‌o‌x‌'‌ ‌c‌o‌u‌l‌d‌n‌'‌t‌ ‌j‌u‌m‌p‌ ‌o‌v‌e‌r‌ ‌t‌h‌e‌ ‌g‌r‌e‌e‌n‌,‌ ‌g‌r‌a‌s‌s‌y‌ ‌h‌i‌l‌l‌."
-        self.assertEqual(
-            aug_unicode_text,
-            [
-                "T\u200ch\u200ce\u200c \u200cq\u200cu\u200ci\u200cc\u200ck\u200c "
-                "\u200cb\u200cr\u200co\u200cw\u200cn\u200c \u200c'\u200cf\u200co"
-                "\u200cx\u200c'\u200c \u200cc\u200co\u200cu\u200cl\u200cd\u200cn"
-                "\u200c'\u200ct\u200c \u200cj\u200cu\u200cm\u200cp\u200c \u200co"
-                "\u200cv\u200ce\u200cr\u200c \u200ct\u200ch\u200ce\u200c \u200cg"
-                "\u200cr\u200ce\u200ce\u200cn\u200c,\u200c \u200cg\u200cr\u200ca"
-                "\u200cs\u200cs\u200cy\u200c \u200ch\u200ci\u200cl\u200cl\u200c."
-            ],
-        )
-        self.assertTrue(
-            are_equal_metadata(
-                self.metadata, self.expected_metadata["insert_zero_width_chars"]
-            ),
+        self.evaluate_class(
+            txtaugs.InsertZeroWidthChars("all", 1.0, False),
+            "insert_zero_width_chars",
+            [ZERO_WIDTH_CHARS_TEXT],
         )
 
     def test_MergeWords(self) -> None:
-        aug_merge_words = txtaugs.MergeWords(aug_word_p=0.3)(
-            self.texts, metadata=self.metadata
-        )
-        self.assertTrue(
-            aug_merge_words[0]
-            == "The quickbrown 'fox' couldn'tjump overthe green, grassy hill."
-        )
-        self.assertTrue(
-            are_equal_metadata(self.metadata, self.expected_metadata["merge_words"]),
+        random.seed(123)
+        self.evaluate_class(
+            txtaugs.MergeWords(aug_word_p=0.3),
+            "merge_words",
+            ["The quickbrown 'fox' couldn'tjump overthe green, grassy hill."],
         )
 
     def test_ReplaceBidirectional(self) -> None:
-        aug_bidirectional_text = txtaugs.ReplaceBidirectional()(
-            self.texts, metadata=self.metadata
-        )
-
         # Renders as: "‮.llih yssarg ,neerg eht revo pmuj t'ndluoc 'xof' nworb kciuq ehT‬"
-        self.assertEqual(
-            aug_bidirectional_text,
+        self.evaluate_class(
+            txtaugs.ReplaceBidirectional(),
+            "replace_bidirectional",
             [
                 "\u202e.llih yssarg ,neerg eht revo pmuj t'ndluoc 'xof' nworb "
                 "kciuq ehT\u202c"
             ],
         )
-        self.assertTrue(
-            are_equal_metadata(
-                self.metadata, self.expected_metadata["replace_bidirectional"]
-            ),
-        )
 
     def test_ReplaceFunFonts(self) -> None:
-        aug_fun_fonts = txtaugs.ReplaceFunFonts(aug_p=0.8, vary_fonts=False, n=1)(
-            self.texts, metadata=self.metadata
-        )
-
-        self.assertTrue(
-            aug_fun_fonts[0]
-            == "𝑻𝒉𝒆 𝒒𝒖𝒊𝒄𝒌 𝒃𝒓𝒐𝒘𝒏 '𝒇𝒐𝒙' 𝒄𝒐𝒖𝒍𝒅𝒏'𝒕 𝒋𝒖𝒎𝒑 𝒐𝒗𝒆𝒓 𝒕𝒉𝒆 𝒈𝒓𝒆𝒆𝒏, 𝒈𝒓𝒂𝒔𝒔𝒚 𝒉𝒊𝒍𝒍."
-        )
-        self.assertTrue(
-            are_equal_metadata(
-                self.metadata, self.expected_metadata["replace_fun_fonts"]
-            ),
+        random.seed(123)
+        self.evaluate_class(
+            txtaugs.ReplaceFunFonts(aug_p=0.8, vary_fonts=False, n=1),
+            "replace_fun_fonts",
+            ["𝑻𝒉𝒆 𝒒𝒖𝒊𝒄𝒌 𝒃𝒓𝒐𝒘𝒏 '𝒇𝒐𝒙' 𝒄𝒐𝒖𝒍𝒅𝒏'𝒕 𝒋𝒖𝒎𝒑 𝒐𝒗𝒆𝒓 𝒕𝒉𝒆 𝒈𝒓𝒆𝒆𝒏, 𝒈𝒓𝒂𝒔𝒔𝒚 𝒉𝒊𝒍𝒍."],
         )
 
     def test_ReplaceSimilarChars(self) -> None:
-        aug_chars = txtaugs.ReplaceSimilarChars(aug_word_p=0.3, aug_char_p=0.3)(
-            self.texts, metadata=self.metadata
-        )
-        self.assertTrue(
-            aug_chars[0]
-            == "The quick brown 'fox' coul|)n't jump 0ver the green, grassy hill."
-        )
-        self.assertTrue(
-            are_equal_metadata(
-                self.metadata, self.expected_metadata["replace_similar_chars"]
-            ),
+        random.seed(123)
+        self.evaluate_class(
+            txtaugs.ReplaceSimilarChars(aug_word_p=0.3, aug_char_p=0.3),
+            "replace_similar_chars",
+            ["The quick brown 'fox' coul|)n't jump 0ver the green, grassy hill."],
         )
 
     def test_ReplaceSimilarUnicodeChars(self) -> None:
-        aug_unicode_chars = txtaugs.ReplaceSimilarUnicodeChars(
-            aug_word_p=0.3, aug_char_p=0.3
-        )(self.texts, metadata=self.metadata)
-
-        self.assertTrue(
-            aug_unicode_chars[0]
-            == "The ℚuick brown 'fox' coul₫n't jump ov६r the green, grassy hill."
-        )
-        self.assertTrue(
-            are_equal_metadata(
-                self.metadata, self.expected_metadata["replace_similar_unicode_chars"]
-            ),
+        random.seed(123)
+        self.evaluate_class(
+            txtaugs.ReplaceSimilarUnicodeChars(aug_word_p=0.3, aug_char_p=0.3),
+            "replace_similar_unicode_chars",
+            ["The ℚuick brown 'fox' coul₫n't jump ov६r the green, grassy hill."],
         )
 
     def test_ReplaceText(self) -> None:
@@ -309,78 +308,45 @@ class TransformsTextUnitTest(unittest.TestCase):
             "jump over the blue": "jump over the red",
             "The quick brown": "The slow green",
         }
-        aug_replaced_text = txtaugs.ReplaceText(replace_texts)(
-            texts=texts, metadata=self.metadata
-        )
-        self.assertEqual(
-            aug_replaced_text, [texts[0], replace_texts[texts[1]], texts[2]]
-        )
-        self.assertTrue(
-            are_equal_metadata(self.metadata, self.expected_metadata["replace_text"]),
+        self.evaluate_class(
+            txtaugs.ReplaceText(replace_texts),
+            "replace_text",
+            [texts[0], replace_texts[texts[1]], texts[2]],
+            texts=texts,
         )
 
     def test_ReplaceUpsideDown(self) -> None:
-        aug_upside_down_text = txtaugs.ReplaceUpsideDown()(
-            self.texts, metadata=self.metadata
-        )
-
-        self.assertTrue(
-            aug_upside_down_text[0]
-            == "˙llᴉɥ ʎssɐɹɓ 'uǝǝɹɓ ǝɥʇ ɹǝʌo dɯnɾ ʇ,uplnoɔ ,xoɟ, uʍoɹq ʞɔᴉnb ǝɥꞱ"
-        )
-        self.assertTrue(
-            are_equal_metadata(
-                self.metadata, self.expected_metadata["replace_upside_down"]
-            ),
+        self.evaluate_class(
+            txtaugs.ReplaceUpsideDown(),
+            "replace_upside_down",
+            ["˙llᴉɥ ʎssɐɹɓ 'uǝǝɹɓ ǝɥʇ ɹǝʌo dɯnɾ ʇ,uplnoɔ ,xoɟ, uʍoɹq ʞɔᴉnb ǝɥꞱ"],
         )
 
     def test_ReplaceWords(self) -> None:
-        augmented_words = txtaugs.ReplaceWords()(self.texts, metadata=self.metadata)
-
-        self.assertTrue(augmented_words[0] == self.texts[0])
-        self.assertTrue(
-            are_equal_metadata(self.metadata, self.expected_metadata["replace_words"]),
-        )
+        self.evaluate_class(txtaugs.ReplaceWords(), "replace_words", self.texts)
 
     def test_SimulateTypos(self) -> None:
-        aug_typo_text = txtaugs.SimulateTypos(
-            aug_word_p=0.3, aug_char_p=0.3, typo_type="all"
-        )(self.texts, metadata=self.metadata)
-
-        self.assertTrue(
-            aug_typo_text[0]
-            == "Thw qu(ck brown 'fox' co)uldn' t jamp over the green, grassy hill.",
-        )
-        self.assertTrue(
-            are_equal_metadata(self.metadata, self.expected_metadata["simulate_typos"]),
+        random.seed(123)
+        self.evaluate_class(
+            txtaugs.SimulateTypos(aug_word_p=0.3, aug_char_p=0.3, typo_type="all"),
+            "simulate_typos",
+            ["Thw qu(ck brown 'fox' co)uldn' t jamp over the green, grassy hill."],
         )
 
     def test_SplitWords(self) -> None:
-        aug_split_words = txtaugs.SplitWords(aug_word_p=0.3)(
-            self.texts, metadata=self.metadata
-        )
-
-        self.assertTrue(
-            aug_split_words[0]
-            == "The quick b rown 'fox' couldn' t j ump over the green, gras sy hill."
-        )
-        self.assertTrue(
-            are_equal_metadata(self.metadata, self.expected_metadata["split_words"]),
+        random.seed(123)
+        self.evaluate_class(
+            txtaugs.SplitWords(aug_word_p=0.3),
+            "split_words",
+            ["The quick b rown 'fox' couldn' t j ump over the green, gras sy hill."],
         )
 
     def test_SwapGenderedWords(self) -> None:
-        augmented_words = txtaugs.SwapGenderedWords()(
-            self.fairness_texts, metadata=self.metadata
-        )
-
-        self.assertTrue(
-            augmented_words[0]
-            == "The queen and king have a daughter named Raj and a son named Amanda.",
-        )
-        self.assertTrue(
-            are_equal_metadata(
-                self.metadata, self.expected_metadata["swap_gendered_words"]
-            ),
+        self.evaluate_class(
+            txtaugs.SwapGenderedWords(),
+            "swap_gendered_words",
+            ["The queen and king have a daughter named Raj and a son named Amanda."],
+            texts=self.fairness_texts,
         )
 
 
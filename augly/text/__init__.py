@@ -7,129 +7,164 @@
 
 # pyre-unsafe
 
-from augly.text.composition import Compose, OneOf
-from augly.text.functional import (
-    apply_lambda,
-    change_case,
-    contractions,
-    get_baseline,
-    insert_punctuation_chars,
-    insert_text,
-    insert_whitespace_chars,
-    insert_zero_width_chars,
-    merge_words,
-    replace_bidirectional,
-    replace_fun_fonts,
-    replace_similar_chars,
-    replace_similar_unicode_chars,
-    replace_text,
-    replace_upside_down,
-    replace_words,
-    simulate_typos,
-    split_words,
-    swap_gendered_words,
-)
-from augly.text.intensity import (
-    apply_lambda_intensity,
-    change_case_intensity,
-    contractions_intensity,
-    get_baseline_intensity,
-    insert_punctuation_chars_intensity,
-    insert_text_intensity,
-    insert_whitespace_chars_intensity,
-    insert_zero_width_chars_intensity,
-    merge_words_intensity,
-    replace_bidirectional_intensity,
-    replace_fun_fonts_intensity,
-    replace_similar_chars_intensity,
-    replace_similar_unicode_chars_intensity,
-    replace_text_intensity,
-    replace_upside_down_intensity,
-    replace_words_intensity,
-    simulate_typos_intensity,
-    split_words_intensity,
-    swap_gendered_words_intensity,
-)
-from augly.text.transforms import (
-    ApplyLambda,
-    ChangeCase,
-    Contractions,
-    GetBaseline,
-    InsertPunctuationChars,
-    InsertText,
-    InsertWhitespaceChars,
-    InsertZeroWidthChars,
-    MergeWords,
-    ReplaceBidirectional,
-    ReplaceFunFonts,
-    ReplaceSimilarChars,
-    ReplaceSimilarUnicodeChars,
-    ReplaceText,
-    ReplaceUpsideDown,
-    ReplaceWords,
-    SimulateTypos,
-    SplitWords,
-    SwapGenderedWords,
-)
+import importlib
+from typing import Any, List, TYPE_CHECKING
 
-__all__ = [
-    "Compose",
-    "OneOf",
-    "ApplyLambda",
-    "ChangeCase",
-    "Contractions",
-    "GetBaseline",
-    "InsertPunctuationChars",
-    "InsertText",
-    "InsertWhitespaceChars",
-    "InsertZeroWidthChars",
-    "MergeWords",
-    "ReplaceBidirectional",
-    "ReplaceFunFonts",
-    "ReplaceSimilarChars",
-    "ReplaceSimilarUnicodeChars",
-    "ReplaceText",
-    "ReplaceUpsideDown",
-    "ReplaceWords",
-    "SimulateTypos",
-    "SplitWords",
-    "SwapGenderedWords",
-    "apply_lambda",
-    "change_case",
-    "contractions",
-    "get_baseline",
-    "insert_punctuation_chars",
-    "insert_text",
-    "insert_whitespace_chars",
-    "insert_zero_width_chars",
-    "merge_words",
-    "replace_bidirectional",
-    "replace_fun_fonts",
-    "replace_similar_chars",
-    "replace_similar_unicode_chars",
-    "replace_text",
-    "replace_upside_down",
-    "replace_words",
-    "simulate_typos",
-    "split_words",
-    "swap_gendered_words",
-    "apply_lambda_intensity",
-    "change_case_intensity",
-    "contractions_intensity",
-    "get_baseline_intensity",
-    "insert_punctuation_chars_intensity",
-    "insert_text_intensity",
-    "insert_whitespace_chars_intensity",
-    "insert_zero_width_chars_intensity",
-    "merge_words_intensity",
-    "replace_bidirectional_intensity",
-    "replace_fun_fonts_intensity",
-    "replace_similar_chars_intensity",
-    "replace_similar_unicode_chars_intensity",
-    "replace_text_intensity",
-    "replace_upside_down_intensity",
-    "replace_words_intensity",
-    "simulate_typos_intensity",
-    "split_words_intensity",
-    "swap_gendered_words_intensity",
-]
+if TYPE_CHECKING:
+    from augly.text.composition import Compose, OneOf  # noqa: F401
+    from augly.text.functional import (  # noqa: F401
+        apply_lambda,
+        change_case,
+        contractions,
+        get_baseline,
+        insert_punctuation_chars,
+        insert_text,
+        insert_whitespace_chars,
+        insert_zero_width_chars,
+        merge_words,
+        replace_bidirectional,
+        replace_fun_fonts,
+        replace_similar_chars,
+        replace_similar_unicode_chars,
+        replace_text,
+        replace_upside_down,
+        replace_words,
+        simulate_typos,
+        split_words,
+        swap_gendered_words,
+    )
+    from augly.text.intensity import (  # noqa: F401
+        apply_lambda_intensity,
+        change_case_intensity,
+        contractions_intensity,
+        get_baseline_intensity,
+        insert_punctuation_chars_intensity,
+        insert_text_intensity,
+        insert_whitespace_chars_intensity,
+        insert_zero_width_chars_intensity,
+        merge_words_intensity,
+        replace_bidirectional_intensity,
+        replace_fun_fonts_intensity,
+        replace_similar_chars_intensity,
+        replace_similar_unicode_chars_intensity,
+        replace_text_intensity,
+        replace_upside_down_intensity,
+        replace_words_intensity,
+        simulate_typos_intensity,
+        split_words_intensity,
+        swap_gendered_words_intensity,
+    )
+    from augly.text.transforms import (  # noqa: F401
+        ApplyLambda,
+        ChangeCase,
+        Contractions,
+        GetBaseline,
+        InsertPunctuationChars,
+        InsertText,
+        InsertWhitespaceChars,
+        InsertZeroWidthChars,
+        MergeWords,
+        ReplaceBidirectional,
+        ReplaceFunFonts,
+        ReplaceSimilarChars,
+        ReplaceSimilarUnicodeChars,
+        ReplaceText,
+        ReplaceUpsideDown,
+        ReplaceWords,
+        SimulateTypos,
+        SplitWords,
+        SwapGenderedWords,
+    )
+
+# Maps each public name to the submodule defining it; these are only imported on
+# first attribute access (PEP 562), so `import augly.text` stays cheap. Keep in
+# sync with the TYPE_CHECKING imports above, which give static type checkers the
+# real types
+_LAZY = {
+    "Compose": "augly.text.composition",
+    "OneOf": "augly.text.composition",
+    "apply_lambda": "augly.text.functional",
+    "change_case": "augly.text.functional",
+    "contractions": "augly.text.functional",
+    "get_baseline": "augly.text.functional",
+    "insert_punctuation_chars": "augly.text.functional",
+    "insert_text": "augly.text.functional",
+    "insert_whitespace_chars": "augly.text.functional",
+    "insert_zero_width_chars": "augly.text.functional",
+    "merge_words": "augly.text.functional",
+    "replace_bidirectional": "augly.text.functional",
+    "replace_fun_fonts": "augly.text.functional",
+    "replace_similar_chars": "augly.text.functional",
+    "replace_similar_unicode_chars": "augly.text.functional",
+    "replace_text": "augly.text.functional",
+    "replace_upside_down": "augly.text.functional",
+    "replace_words": "augly.text.functional",
+    "simulate_typos": "augly.text.functional",
+    "split_words": "augly.text.functional",
+    "swap_gendered_words": "augly.text.functional",
+    "apply_lambda_intensity": "augly.text.intensity",
+    "change_case_intensity": "augly.text.intensity",
+    "contractions_intensity": "augly.text.intensity",
+    "get_baseline_intensity": "augly.text.intensity",
+    "insert_punctuation_chars_intensity": "augly.text.intensity",
+    "insert_text_intensity": "augly.text.intensity",
+    "insert_whitespace_chars_intensity": "augly.text.intensity",
+    "insert_zero_width_chars_intensity": "augly.text.intensity",
+    "merge_words_intensity": "augly.text.intensity",
+    "replace_bidirectional_intensity": "augly.text.intensity",
+    "replace_fun_fonts_intensity": "augly.text.intensity",
+    "replace_similar_chars_intensity": "augly.text.intensity",
+    "replace_similar_unicode_chars_intensity": "augly.text.intensity",
+    "replace_text_intensity": "augly.text.intensity",
+    "replace_upside_down_intensity": "augly.text.intensity",
+    "replace_words_intensity": "augly.text.intensity",
+    "simulate_typos_intensity": "augly.text.intensity",
+    "split_words_intensity": "augly.text.intensity",
+    "swap_gendered_words_intensity": "augly.text.intensity",
+    "ApplyLambda": "augly.text.transforms",
+    "ChangeCase": "augly.text.transforms",
+    "Contractions": "augly.text.transforms",
+    "GetBaseline": "augly.text.transforms",
+    "InsertPunctuationChars": "augly.text.transforms",
+    "InsertText": "augly.text.transforms",
+    "InsertWhitespaceChars": "augly.text.transforms",
+    "InsertZeroWidthChars": "augly.text.transforms",
+    "MergeWords": "augly.text.transforms",
+    "ReplaceBidirectional": "augly.text.transforms",
+    "ReplaceFunFonts": "augly.text.transforms",
+    "ReplaceSimilarChars": "augly.text.transforms",
+    "ReplaceSimilarUnicodeChars": "augly.text.transforms",
+    "ReplaceText": "augly.text.transforms",
+    "ReplaceUpsideDown": "augly.text.transforms",
+    "ReplaceWords": "augly.text.transforms",
+    "SimulateTypos": "augly.text.transforms",
+    "SplitWords": "augly.text.transforms",
+    "SwapGenderedWords": "augly.text.transforms",
+}
+
+_SUBMODULES = {
+    "augmenters",
+    "composition",
+    "functional",
+    "intensity",
+    "transforms",
+    "utils",
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})